@@ -11,49 +11,311 @@ flags: --dd and --list.
 Requires:
     - pyyaml (already required)
     - questionary (optional; if missing, falls back to text prompts)
+
+yaml, questionary and curses are imported on first use, so commands that
+don't need them don't pay their import time.
 """
 
 from __future__ import annotations
 
-import argparse
+import errno
+import functools
 import json
 import os
-import shutil
+import re
+import stat
 import sys
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    import curses
 
-import yaml
+# Frontmatter lives at the top of SKILL.md; read it in small chunks and give up
+# past a sane limit instead of loading whole files.
+_FRONTMATTER_CHUNK_SIZE = 8192
+_FRONTMATTER_MAX_BYTES = 64 * 1024
+
+# Simple frontmatter parsing without PyYAML. A header containing block scalars,
+# anchors/aliases, indented lines, control characters (YAML rejects them) or
+# \r, NEL, U+2028/U+2029 (YAML line breaks) always goes to the YAML loader;
+# plain values with indicators, comments, YAML-typed scalars (bools, numbers,
+# null) or the << merge key do too, and so do keys YAML would resolve to a bool
+# or null (keys can't start with a digit, so they never resolve to numbers).
+_SIMPLE_FM_RE = re.compile(
+    rb"^(?!(?i:true|false|yes|no|on|off|null|y|n) *:)"
+    rb"([A-Za-z_][A-Za-z0-9_-]*) *:(?: +(.*))?$"
+)
+_SIMPLE_FM_FALLBACK_RE = re.compile(
+    rb"[>|&*]|^[ \t]|[\x00-\x08\x0b-\x1f\x7f]"
+    rb"|\xc2[\x80-\x9f]|\xe2\x80[\xa8\xa9]|\xef\xbb\xbf|\xef\xbf[\xbe\xbf]",
+    re.MULTILINE,
+)
+_SIMPLE_FM_UNSAFE_RE = re.compile(
+    rb"^[-?:,\[\]{}#&*!|>'\"%@`~=]|: | #|:$|\t"
+    rb"|^[-+]?\.?[0-9]|^[-+]?\.(?i:inf|nan)$"
+    rb"|^(?i:true|false|yes|no|on|off|null|y|n)$|^<<$"
+)
+
+# Parsed frontmatter keyed by (absolute path, mtime_ns, size); see
+# parse_frontmatter_cached.
+_FM_CACHE: dict[tuple[str, int, int], Optional[dict]] = {}
+
+# Chunk size for os.copy_file_range when installing skills, and the errors that
+# mean "not supported here" and trigger a plain read/write copy instead.
+_COPY_CHUNK_SIZE = 1024 * 1024
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+
+# Home directory resolved once; see _expand.
+_HOME = os.path.expanduser("~")
+_POSIX_SEP = os.sep == "/"
+# Appended to DirEntry.path, which is already joined and never ends in a sep.
+_SKILL_MD_SUFFIX = os.sep + "SKILL.md"
+
+# SKILL.md files are loaded serially unless a command has at least
+# _IO_PARALLEL_MIN_SKILLS of them; parsing holds the GIL, and with a cold page
+# cache the pool only broke even at about 5000 local skills (it was slower at
+# every size with a warm one). SKILLER_IO_THREADS sets the pool size and, when
+# above 1, uses the pool for any batch (e.g. on slow network filesystems).
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_IO_WORKERS_ENV = "SKILLER_IO_THREADS"
+_IO_PARALLEL_MIN_SKILLS = 5000
+
+
+@functools.cache
+def _expand(path: str) -> str:
+    """Expand a leading ~ like os.path.expanduser, using the cached home dir."""
+    if path == "~":
+        return _HOME
+    if path.startswith("~/"):
+        return _HOME.rstrip("/") + path[1:]
+    if path.startswith("~"):
+        return os.path.expanduser(path)
+    return path
+
+
+def _join_name(parent: str, name: str) -> str:
+    """Join a single directory entry name onto parent.
+
+    Uses plain string concatenation when the separator is /, falling back to
+    os.path.join elsewhere.
+    """
+    if not _POSIX_SEP:
+        return os.path.join(parent, name)
+    if not parent or parent.endswith("/"):
+        return parent + name
+    return f"{parent}/{name}"
 
-# Try to import questionary for nice cursor-based menus. If it's not installed
-# or importing fails, we'll fall back to curses or simple input() prompts.
-try:
-    import questionary  # type: ignore
-    from questionary import Choice  # type: ignore
 
-    _HAVE_QUESTIONARY = True
-except Exception:
-    _HAVE_QUESTIONARY = False
+def _index_agent_dirs(agent_dirs: dict) -> tuple[dict[str, str], List[str]]:
+    """Index the agent_dirs config for listing.
 
-try:
-    import curses
+    Returns a mapping from expanded path to a label like "opencode[user]" and
+    the list of all configured (unexpanded) paths, deduplicated in config order.
+    A malformed agent_dirs (not a mapping) indexes as empty.
+    """
+    path_to_label: dict[str, str] = {}
+    if not isinstance(agent_dirs, dict):
+        return path_to_label, []
+    for agent, ad in agent_dirs.items():
+        if not isinstance(ad, dict):
+            continue
+        for path_type in ("user", "project"):
+            for path in ad.get(path_type, []):
+                path_to_label[_expand(path)] = f"{agent}[{path_type}]"
+    return path_to_label, _all_configured_paths(agent_dirs)
+
+
+def _all_configured_paths(agent_dirs: dict) -> List[str]:
+    """Return all user and project paths in config order, without duplicates."""
+    if not isinstance(agent_dirs, dict):
+        return []
+    # dict.fromkeys dedups in C while keeping first-seen order
+    return list(
+        dict.fromkeys(
+            p
+            for a in agent_dirs.values()
+            if isinstance(a, dict)
+            for p in (*a.get("user", ()), *a.get("project", ()))
+        )
+    )
+
+
+@functools.cache
+def _get_yaml() -> tuple:
+    """Import PyYAML on first use and return (yaml, safe loader class).
+
+    Prefers the libyaml-backed CSafeLoader, which parses much faster than the
+    pure-Python SafeLoader and accepts the same documents.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader  # type: ignore[assignment]
+    return yaml, loader
+
+
+@functools.cache
+def _get_json_loads():
+    """Return orjson.loads when orjson is installed, else json.loads.
+
+    Both accept bytes and raise a json.JSONDecodeError subclass on bad input.
+    """
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        return json.loads
+    return orjson.loads
 
-    _HAVE_CURSES = True
-except Exception:
-    _HAVE_CURSES = False
 
+@functools.cache
+def _get_questionary():
+    """Import questionary for cursor-based menus on first use.
 
+    Returns None if it's not installed or importing fails; callers then fall
+    back to curses or simple input() prompts.
+    """
+    try:
+        import questionary  # type: ignore
+    except Exception:
+        return None
+    return questionary
+
+
+@functools.cache
+def _get_curses():
+    """Import curses on first use, returning None when unavailable."""
+    try:
+        import curses
+    except Exception:
+        return None
+    return curses
+
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load configuration from skiller_config.json located next to this file."""
+    """Load configuration from skiller_config.json located next to this file.
+
+    The result is memoized for the process; treat it as read-only.
+    """
     config_path = os.path.join(os.path.dirname(__file__), "skiller_config.json")
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(config_path, "rb") as f:
+            raw = f.read()
+        config = _get_json_loads()(raw)
     except FileNotFoundError:
         print(f"Error: Configuration file {config_path} not found.", file=sys.stderr)
         sys.exit(1)
     except json.JSONDecodeError:
         print(f"Error: Invalid JSON in {config_path}.", file=sys.stderr)
         sys.exit(1)
+    # Derived data used by the list commands, computed once per load
+    path_to_label, all_paths = _index_agent_dirs(config.get("agent_dirs", {}) or {})
+    config["_path_label_map"] = path_to_label
+    config["_all_paths"] = all_paths
+    return config
+
+
+def _read_frontmatter_bytes(file_path: str) -> Optional[bytes]:
+    """Return the raw frontmatter block (between the --- lines) of a file.
+
+    Only the head of the file is read, in _FRONTMATTER_CHUNK_SIZE steps, until the
+    closing --- line shows up or _FRONTMATTER_MAX_BYTES is reached. Returns None
+    when the file has no complete frontmatter block within that limit.
+    """
+    # Plain os.open/os.read: a buffered open() adds fstat, ioctl and lseek calls
+    # on top of the reads, which adds up over many small files.
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        # Check the opening --- line first so files without frontmatter cost a
+        # single tiny read.
+        head = os.read(fd, 4)
+        if head == b"---\r":
+            head += os.read(fd, 1)
+        if head not in (b"---\n", b"---\r\n"):
+            return None
+        data = (head + os.read(fd, _FRONTMATTER_CHUNK_SIZE)).replace(b"\r\n", b"\n")
+        # bytes.find runs in C and resumes where the last chunk left off; an
+        # anchored \A---\n(.*?)\n---\n regex would rescan from the start on
+        # every chunk, and the opening line is already checked above.
+        search_from = 4
+        while True:
+            end_pos = data.find(b"\n---\n", search_from)
+            if end_pos != -1:
+                return data[4:end_pos]
+            if len(data) >= _FRONTMATTER_MAX_BYTES:
+                return None
+            chunk = os.read(fd, _FRONTMATTER_CHUNK_SIZE)
+            if not chunk:
+                return None
+            # Only scan and normalize the new bytes, plus enough of the old tail
+            # for a marker or \r\n pair that straddles the chunk boundary.
+            if data.endswith(b"\r"):
+                data, chunk = data[:-1], b"\r" + chunk
+            search_from = max(4, len(data) - 4)
+            data += chunk.replace(b"\r\n", b"\n")
+    finally:
+        os.close(fd)
+
+
+def _load_frontmatter_yaml(header: bytes) -> Optional[dict]:
+    """Parse a raw frontmatter block with the YAML loader.
+
+    The bytes go to the loader as-is; it decodes them itself, so there is no
+    intermediate str copy.
+    """
+    yaml, loader = _get_yaml()
+    parsed = yaml.load(header, Loader=loader)
+    if isinstance(parsed, dict):
+        return parsed
+    return None
+
+
+def _parse_simple_frontmatter(header: bytes) -> Optional[dict]:
+    """Parse a flat frontmatter block of plain key: value lines without PyYAML.
+
+    Returns None when the block is empty or any line needs the real YAML parser
+    (block scalars, anchors, nesting, flow collections, escapes, non-string
+    scalars, control characters, ...), so a non-None result equals what the
+    YAML loader returns.
+    """
+    if _SIMPLE_FM_FALLBACK_RE.search(header):
+        return None
+    result: dict = {}
+    for line in header.split(b"\n"):
+        if not line.strip() or line.startswith(b"#"):
+            continue
+        match = _SIMPLE_FM_RE.match(line)
+        if match is None:
+            return None
+        value = (match.group(2) or b"").strip()
+        if not value:
+            parsed_value = None
+        elif value[:1] in (b'"', b"'"):
+            quote = value[:1]
+            inner = value[1:-1]
+            if len(value) < 2 or value[-1:] != quote:
+                return None
+            if quote in inner or b"\\" in inner:
+                return None
+            parsed_value = inner.decode("utf-8")
+        elif _SIMPLE_FM_UNSAFE_RE.search(value):
+            return None
+        else:
+            parsed_value = value.decode("utf-8")
+        result[match.group(1).decode("ascii")] = parsed_value
+    if not result:
+        return None
+    return result
+
+
+def _load_frontmatter(header: bytes) -> Optional[dict]:
+    """Parse a raw frontmatter block, skipping PyYAML when the block is simple."""
+    parsed = _parse_simple_frontmatter(header)
+    if parsed is not None:
+        return parsed
+    return _load_frontmatter_yaml(header)
 
 
 def parse_frontmatter(file_path: str) -> Optional[dict]:
@@ -62,75 +324,235 @@ def parse_frontmatter(file_path: str) -> Optional[dict]:
     Returns the parsed YAML mapping or None if not present/invalid.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        if not content.startswith("---\n"):
-            return None
-        end_pos = content.find("\n---\n", 4)
-        if end_pos == -1:
+        header = _read_frontmatter_bytes(file_path)
+        if header is None:
             return None
-        frontmatter_str = content[4:end_pos]
-        parsed = yaml.safe_load(frontmatter_str)
-        if isinstance(parsed, dict):
-            return parsed
-        return None
+        return _load_frontmatter(header)
     except Exception:
         return None
 
 
-def discover_skills(dir_path: str, agent_subdirs: Iterable[str]) -> None:
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    """Return entry.is_dir(), or False if the entry can't be stat'ed.
+
+    Matches os.path.isdir, so a broken symlink or symlink loop is skipped
+    instead of aborting the whole listing.
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _sorted_subdirs(path: str) -> Optional[List[os.DirEntry]]:
+    """Return the subdirectory entries of path, sorted by name.
+
+    Uses a single os.scandir pass so directory checks come from the cached entry
+    type instead of a stat per child, and callers can reuse entry.name and
+    entry.path without joining again. Returns None if path is missing, not a
+    directory or otherwise unreadable (like os.path.isdir returning False), so
+    callers need no separate isdir check; PermissionError propagates so callers
+    can report it.
+    """
+    try:
+        with os.scandir(path) as it:
+            subdirs = [entry for entry in it if _entry_is_dir(entry)]
+    except PermissionError:
+        raise
+    except OSError:
+        return None
+    subdirs.sort(key=lambda entry: entry.name)
+    return subdirs
+
+
+def _stat_regular_file(path: str) -> Optional[os.stat_result]:
+    """Return the stat result for path if it is a regular file, otherwise None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return st
+
+
+def parse_frontmatter_cached(
+    file_path: str, st: Optional[os.stat_result] = None
+) -> Optional[dict]:
+    """Parse frontmatter like parse_frontmatter, memoized for the process.
+
+    Entries are keyed by (absolute path, mtime_ns, size) so an edited file is
+    parsed again. Pass st when the caller already has the file's stat result.
+    """
+    if st is None:
+        st = _stat_regular_file(file_path)
+        if st is None:
+            return None
+    key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    if key in _FM_CACHE:
+        return _FM_CACHE[key]
+    parsed = parse_frontmatter(file_path)
+    _FM_CACHE[key] = parsed
+    return parsed
+
+
+def _load_skill_meta(skill_path: str) -> dict:
+    """Stat and parse the SKILL.md of a single skill directory.
+
+    One stat answers both "is there a SKILL.md file?" and supplies the
+    frontmatter cache key. Returns a dict with "has_skill_md" (bool) and
+    "frontmatter" (parsed mapping or None). skill_path is expected to come from
+    DirEntry.path.
+    """
+    skill_md = skill_path + _SKILL_MD_SUFFIX
+    skill_md_stat = _stat_regular_file(skill_md)
+    if skill_md_stat is None:
+        return {"has_skill_md": False, "frontmatter": None}
+    return {
+        "has_skill_md": True,
+        "frontmatter": parse_frontmatter_cached(skill_md, skill_md_stat),
+    }
+
+
+@functools.cache
+def _io_workers() -> Optional[int]:
+    """Return the thread pool size set by SKILLER_IO_THREADS, if any."""
+    raw = os.environ.get(_IO_WORKERS_ENV)
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            print(f"Ignoring invalid {_IO_WORKERS_ENV}={raw!r}.", file=sys.stderr)
+    return None
+
+
+def _load_skill_metas(skill_paths: List[str]) -> List[dict]:
+    """Run _load_skill_meta over skill_paths, preserving order.
+
+    Uses a thread pool only for large batches or when SKILLER_IO_THREADS asks
+    for one; see _IO_PARALLEL_MIN_SKILLS.
+    """
+    workers = _io_workers()
+    if workers is None:
+        workers = _IO_WORKERS if len(skill_paths) >= _IO_PARALLEL_MIN_SKILLS else 1
+    workers = min(workers, len(skill_paths))
+    if workers < 2:
+        return [_load_skill_meta(path) for path in skill_paths]
+    # Deferred: concurrent.futures pulls in logging and threading at import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_load_skill_meta, skill_paths))
+
+
+def _scan_skill_roots(
+    roots: List[str],
+) -> List[tuple[Optional[List[os.DirEntry]], List[dict], bool]]:
+    """Scan each skill root and load the SKILL.md metadata of all of them at once.
+
+    Returns one (skill_dirs, metas, denied) tuple per root, in order. skill_dirs
+    is None when the root is missing or, with denied set, unreadable; metas
+    lines up with skill_dirs. Batching lets a command use at most one pool.
+    """
+    scans: List[tuple[Optional[List[os.DirEntry]], bool]] = []
+    for root in roots:
+        try:
+            scans.append((_sorted_subdirs(root), False))
+        except PermissionError:
+            scans.append((None, True))
+    all_metas = _load_skill_metas(
+        [entry.path for skill_dirs, _ in scans if skill_dirs for entry in skill_dirs]
+    )
+    result = []
+    start = 0
+    for skill_dirs, denied in scans:
+        end = start + len(skill_dirs or ())
+        result.append((skill_dirs, all_metas[start:end], denied))
+        start = end
+    return result
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write lines to stdout with a single write call and flush."""
+    if not lines:
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def discover_skills(
+    dir_path: str, agent_subdirs: Iterable[str], verbose: bool = False
+) -> None:
     """Discover potential skills in the given directory.
 
     For each subdir in agent_subdirs, looks for that subdirectory under dir_path
     (e.g., dir_path/.opencode/skills) and lists any contained skill directories
-    and whether they have valid SKILL.md frontmatter.
+    and whether they have valid SKILL.md frontmatter. Missing subdirs are only
+    reported when verbose is set.
     """
-    dir_path_exp = os.path.expanduser(dir_path)
-    if not os.path.isdir(dir_path_exp):
-        print(f"Error: Directory '{dir_path_exp}' does not exist.", file=sys.stderr)
-        return
-
+    dir_path_exp = _expand(dir_path)
+    out: List[str] = []
     found_any = False
-    for sub in agent_subdirs:
-        agent_path = os.path.join(dir_path_exp, sub)
-        if os.path.exists(agent_path) and os.path.isdir(agent_path):
-            print(f"\nFound agent directory: {agent_path}")
+    agent_paths = [os.path.join(dir_path_exp, sub) for sub in agent_subdirs]
+    for agent_path, (skill_dirs, metas, denied) in zip(
+        agent_paths, _scan_skill_roots(agent_paths)
+    ):
+        if denied:
             found_any = True
-            try:
-                items = os.listdir(agent_path)
-                skill_dirs = [item for item in items if os.path.isdir(os.path.join(agent_path, item))]
-                if skill_dirs:
-                    print("  Potential skills:")
-                    for skill in sorted(skill_dirs):
-                        skill_path = os.path.join(agent_path, skill)
-                        skill_md = os.path.join(skill_path, "SKILL.md")
-                        if os.path.isfile(skill_md):
-                            fm = parse_frontmatter(skill_md)
-                            if fm and "name" in fm and "description" in fm:
-                                if fm["name"] == skill:
-                                    desc = str(fm["description"]).replace("\n", " ")[:120]
-                                    print(f"    - {skill}: {desc}")
-                                else:
-                                    print(f"    - {skill}: (frontmatter name mismatch)")
-                            else:
-                                print(f"    - {skill}: (invalid or missing frontmatter)")
-                        else:
-                            print(f"    - {skill}: (no SKILL.md)")
+            out.append(f"\nFound agent directory: {agent_path}")
+            out.append(f"  Permission denied accessing {agent_path}.")
+            continue
+        if skill_dirs is None:
+            if verbose:
+                # missing directories are expected; only mention them when asked to
+                out.append(f"\nNo agent directory found at: {agent_path}")
+            continue
+        out.append(f"\nFound agent directory: {agent_path}")
+        found_any = True
+        if not skill_dirs:
+            out.append("  No skill directories found.")
+            continue
+        out.append("  Potential skills:")
+        for entry, meta in zip(skill_dirs, metas):
+            skill = entry.name
+            if meta["has_skill_md"]:
+                fm = meta["frontmatter"]
+                if fm and "name" in fm and "description" in fm:
+                    if fm["name"] == skill:
+                        desc = str(fm["description"]).replace("\n", " ")[:120]
+                        out.append(f"    - {skill}: {desc}")
+                    else:
+                        out.append(f"    - {skill}: (frontmatter name mismatch)")
                 else:
-                    print("  No skill directories found.")
-            except PermissionError:
-                print(f"  Permission denied accessing {agent_path}.")
-        else:
-            # don't print an error for every expected but missing directory; print a short message
-            print(f"\nNo agent directory found at: {os.path.join(dir_path_exp, sub)}")
+                    out.append(f"    - {skill}: (invalid or missing frontmatter)")
+            else:
+                out.append(f"    - {skill}: (no SKILL.md)")
 
     if not found_any:
-        print("\nNo known agent directories found in the specified directory.")
+        # Only now check the base directory itself; when any agent directory
+        # was found it must exist, which saves a stat on the common path.
+        if not os.path.isdir(dir_path_exp):
+            print(f"Error: Directory '{dir_path_exp}' does not exist.", file=sys.stderr)
+            return
+        out.append("\nNo known agent directories found in the specified directory.")
+    _write_lines(out)
 
 
-def _format_relative_path(path: str, base_dir: str) -> str:
-    """Return path relative to base_dir with a ./ prefix when appropriate."""
-    rel_path = os.path.relpath(path, start=base_dir)
+def _format_relative_path(path: str, abs_base: str) -> str:
+    """Return path relative to abs_base with a ./ prefix when appropriate.
+
+    abs_base must already be absolute. Normalized paths under it are handled by
+    slicing; anything else goes through os.path.relpath (which calls getcwd).
+    """
+    prefix = abs_base if abs_base.endswith(os.sep) else abs_base + os.sep
+    if path == abs_base:
+        return "./"
+    if path.startswith(prefix):
+        rel_path = path[len(prefix):]
+        parts = rel_path.split(os.sep)
+        if "" not in parts and "." not in parts and ".." not in parts:
+            return f"./{rel_path}"
+    rel_path = os.path.relpath(path, start=abs_base)
     if rel_path == ".":
         return "./"
     if rel_path.startswith("../"):
@@ -142,72 +564,76 @@ def _format_relative_path(path: str, base_dir: str) -> str:
 
 def list_skills_simple(dir_path: str, agent_subdirs: Iterable[str]) -> None:
     """List skills with one line per skill: dir skill description."""
-    dir_path_exp = os.path.expanduser(dir_path)
-    if not os.path.isdir(dir_path_exp):
-        print(f"Error: Directory '{dir_path_exp}' does not exist.", file=sys.stderr)
-        return
-
+    dir_path_exp = _expand(dir_path)
+    abs_base = os.path.abspath(dir_path_exp)
+    out: List[str] = []
     found_any = False
-    for sub in agent_subdirs:
-        agent_path = os.path.join(dir_path_exp, sub)
-        if not os.path.isdir(agent_path):
+    agent_paths = [os.path.join(dir_path_exp, sub) for sub in agent_subdirs]
+    for agent_path, (skill_dirs, metas, denied) in zip(
+        agent_paths, _scan_skill_roots(agent_paths)
+    ):
+        if denied:
+            found_any = True
+            out.append(f"Permission denied accessing {agent_path}.")
+            continue
+        if skill_dirs is None:
             continue
         found_any = True
-        try:
-            items = os.listdir(agent_path)
-            skill_dirs = [item for item in items if os.path.isdir(os.path.join(agent_path, item))]
-            for skill in sorted(skill_dirs):
-                skill_path = os.path.join(agent_path, skill)
-                skill_md = os.path.join(skill_path, "SKILL.md")
-                description = "(no description)"
-                if os.path.isfile(skill_md):
-                    fm = parse_frontmatter(skill_md)
-                    if fm and isinstance(fm, dict):
-                        raw_desc = fm.get("description")
-                        if raw_desc:
-                            description = str(raw_desc).replace("\n", " ")
-                rel_agent_path = _format_relative_path(agent_path, dir_path_exp)
-                print(f"{rel_agent_path} {skill} {description}")
-        except PermissionError:
-            print(f"Permission denied accessing {agent_path}.")
+        rel_agent_path = _format_relative_path(agent_path, abs_base)
+        for entry, meta in zip(skill_dirs, metas):
+            skill = entry.name
+            description = "(no description)"
+            fm = meta["frontmatter"]
+            if fm and isinstance(fm, dict):
+                raw_desc = fm.get("description")
+                if raw_desc:
+                    description = str(raw_desc).replace("\n", " ")
+            out.append(f"{rel_agent_path} {skill} {description}")
     if not found_any:
-        print("No known agent directories found in the specified directory.")
+        # See discover_skills: the base directory is only checked when needed
+        if not os.path.isdir(dir_path_exp):
+            print(f"Error: Directory '{dir_path_exp}' does not exist.", file=sys.stderr)
+            return
+        out.append("No known agent directories found in the specified directory.")
+    _write_lines(out)
 
 
 def _gather_skill_candidates(base_dir: str, subdirs: Iterable[str]) -> List[dict[str, str]]:
     """Return discovered skills under the given subdirectories."""
     candidates: List[dict[str, str]] = []
+    skill_entries: List[os.DirEntry] = []
     for sub in subdirs:
         search_path = os.path.join(base_dir, sub)
-        if not os.path.isdir(search_path):
-            continue
         try:
-            items = os.listdir(search_path)
+            valid_dirs = _sorted_subdirs(search_path)
         except PermissionError:
             print(f"Permission denied accessing {search_path}.")
             continue
-        valid_dirs = [item for item in items if os.path.isdir(os.path.join(search_path, item))]
-        for skill in sorted(valid_dirs):
-            skill_path = os.path.join(search_path, skill)
-            description = "(no description)"
-            display_name = skill
-            skill_md = os.path.join(skill_path, "SKILL.md")
-            if os.path.isfile(skill_md):
-                fm = parse_frontmatter(skill_md)
-                if fm and isinstance(fm, dict):
-                    display_name = fm.get("name") or skill
-                    raw_desc = fm.get("description")
-                    if raw_desc:
-                        description = str(raw_desc).replace("\n", " ")
-            candidates.append(
-                {
-                    "name": display_name,
-                    "description": description,
-                    "path": skill_path,
-                    "rel_path": _format_relative_path(skill_path, base_dir),
-                    "folder_name": os.path.basename(skill_path),
-                }
-            )
+        if valid_dirs:
+            skill_entries.extend(valid_dirs)
+
+    abs_base = os.path.abspath(base_dir)
+    metas = _load_skill_metas([entry.path for entry in skill_entries])
+    for entry, meta in zip(skill_entries, metas):
+        skill_path = entry.path
+        folder_name = entry.name
+        description = "(no description)"
+        display_name = folder_name
+        fm = meta["frontmatter"]
+        if fm and isinstance(fm, dict):
+            display_name = fm.get("name") or folder_name
+            raw_desc = fm.get("description")
+            if raw_desc:
+                description = str(raw_desc).replace("\n", " ")
+        candidates.append(
+            {
+                "name": display_name,
+                "description": description,
+                "path": skill_path,
+                "rel_path": _format_relative_path(skill_path, abs_base),
+                "folder_name": folder_name,
+            }
+        )
     return candidates
 
 
@@ -216,54 +642,48 @@ def list_installed_skills_for_paths(config: dict, paths: Iterable[str]) -> None:
 
     Each path is considered a skills root containing subdirectories for each skill.
     """
-    # Build mapping from expanded path to label like "opencode[user]"
-    path_to_label = {}
-    for agent, ad in config.get("agent_dirs", {}).items():
-        if not isinstance(ad, dict):
-            continue
-        for path_type in ["user", "project"]:
-            for path in ad.get(path_type, []):
-                expanded = os.path.expanduser(path)
-                path_to_label[expanded] = f"{agent}[{path_type}]"
+    # Mapping from expanded path to label like "opencode[user]"
+    path_to_label = config.get("_path_label_map")
+    if path_to_label is None:
+        path_to_label, _ = _index_agent_dirs(config.get("agent_dirs", {}) or {})
 
+    out: List[str] = []
     any_found = False
-    for p in paths:
-        p_expanded = os.path.expanduser(p)
-        if not os.path.isdir(p_expanded):
-            label = path_to_label.get(p_expanded, p_expanded)
-            print(f"(missing) {label}")
+    expanded = [_expand(p) for p in paths]
+    for p_expanded, (skill_dirs, metas, denied) in zip(
+        expanded, _scan_skill_roots(expanded)
+    ):
+        label = path_to_label.get(p_expanded, p_expanded)
+        if denied:
+            out.append(f"Permission denied accessing {label}.")
             continue
-        try:
-            items = os.listdir(p_expanded)
-            skill_dirs = [item for item in items if os.path.isdir(os.path.join(p_expanded, item))]
-            if skill_dirs:
-                any_found = True
-                label = path_to_label.get(p_expanded, p_expanded)
-                print(f"\nSkills in {label}:")
-                for skill in sorted(skill_dirs):
-                    skill_md = os.path.join(p_expanded, skill, "SKILL.md")
-                    if os.path.isfile(skill_md):
-                        fm = parse_frontmatter(skill_md)
-                        if fm and isinstance(fm, dict):
-                            name = fm.get("name")
-                            desc = fm.get("description", "")
-                            desc_short = (str(desc).replace("\n", " ")[:80] + "...") if desc else "(no description)"
-                            if name and name == skill:
-                                print(f"  - {skill}: {desc_short}")
-                            else:
-                                print(f"  - {skill}: (frontmatter missing or name mismatch)")
-                        else:
-                            print(f"  - {skill}: (invalid frontmatter)")
+        if skill_dirs is None:
+            out.append(f"(missing) {label}")
+            continue
+        if not skill_dirs:
+            out.append(f"No skills found under {label}.")
+            continue
+        any_found = True
+        out.append(f"\nSkills in {label}:")
+        for entry, meta in zip(skill_dirs, metas):
+            skill = entry.name
+            if meta["has_skill_md"]:
+                fm = meta["frontmatter"]
+                if fm and isinstance(fm, dict):
+                    name = fm.get("name")
+                    desc = fm.get("description", "")
+                    desc_short = (str(desc).replace("\n", " ")[:80] + "...") if desc else "(no description)"
+                    if name and name == skill:
+                        out.append(f"  - {skill}: {desc_short}")
                     else:
-                        print(f"  - {skill}: (no SKILL.md)")
+                        out.append(f"  - {skill}: (frontmatter missing or name mismatch)")
+                else:
+                    out.append(f"  - {skill}: (invalid frontmatter)")
             else:
-                label = path_to_label.get(p_expanded, p_expanded)
-                print(f"No skills found under {label}.")
-        except PermissionError:
-            label = path_to_label.get(p_expanded, p_expanded)
-            print(f"Permission denied accessing {label}.")
+                out.append(f"  - {skill}: (no SKILL.md)")
     if not any_found:
-        print("\nNo skills discovered in the provided paths.")
+        out.append("\nNo skills discovered in the provided paths.")
+    _write_lines(out)
 
 
 #
@@ -282,7 +702,7 @@ def _format_prompt(message: str, hint: Optional[str] = None) -> str:
 
 
 def _can_use_curses() -> bool:
-    return _HAVE_CURSES and sys.stdin.isatty() and sys.stdout.isatty()
+    return sys.stdin.isatty() and sys.stdout.isatty() and _get_curses() is not None
 
 
 def _try_curses_single_select(
@@ -290,6 +710,7 @@ def _try_curses_single_select(
 ) -> tuple[bool, Optional[str]]:
     if not _can_use_curses():
         return False, None
+    curses = _get_curses()
     try:
         default_index = choices.index(default) if default in choices else 0
 
@@ -327,6 +748,7 @@ def _try_curses_multi_select(
 ) -> tuple[bool, Optional[List[str]]]:
     if not _can_use_curses():
         return False, None
+    curses = _get_curses()
     try:
         default_indices = {choices.index(item) for item in default if item in choices}
 
@@ -372,10 +794,11 @@ def _select_option(message: str, choices: List[str], default: Optional[str] = No
 
     Returns the selected choice string or None if user cancelled.
     """
-    if _HAVE_QUESTIONARY:
+    prompt = _format_prompt(message, _SINGLE_SELECT_HINT)
+    questionary = _get_questionary()
+    if questionary is not None:
         try:
-            q_choices = [Choice(c) for c in choices]
-            prompt = _format_prompt(message, _SINGLE_SELECT_HINT)
+            q_choices = [questionary.Choice(c) for c in choices]
             if default and default in choices:
                 selected = questionary.select(prompt, choices=q_choices, default=default).ask()
             else:
@@ -392,12 +815,12 @@ def _select_option(message: str, choices: List[str], default: Optional[str] = No
         return selected
 
     # Fallback: show numbered menu and accept a number or name
-    print()
-    print(_format_prompt(message, _SINGLE_SELECT_HINT))
+    menu = ["", prompt]
     for i, c in enumerate(choices, start=1):
         marker = " (default)" if default and c == default else ""
-        print(f"  {i}) {c}{marker}")
-    print("  q) Quit")
+        menu.append(f"  {i}) {c}{marker}")
+    menu.append("  q) Quit")
+    print("\n".join(menu))
     while True:
         choice = input("Select an option (number or name): ").strip()
         if choice.lower() in ("q", "quit", "exit"):
@@ -418,10 +841,11 @@ def _select_multiple(
     message: str, choices: List[str], default: Optional[List[str]] = None
 ) -> Optional[List[str]]:
     """Select multiple options using questionary when available."""
-    if _HAVE_QUESTIONARY:
+    prompt = _format_prompt(message, _MULTI_SELECT_HINT)
+    questionary = _get_questionary()
+    if questionary is not None:
         try:
-            q_choices = [Choice(c) for c in choices]
-            prompt = _format_prompt(message, _MULTI_SELECT_HINT)
+            q_choices = [questionary.Choice(c) for c in choices]
             picked = questionary.checkbox(prompt, choices=q_choices, default=default or []).ask()
             if picked is None:
                 return None
@@ -434,12 +858,12 @@ def _select_multiple(
     if ran_curses:
         return selected
 
-    print()
-    print(_format_prompt(message, _MULTI_SELECT_HINT))
+    menu = ["", prompt]
     for idx, choice in enumerate(choices, start=1):
         marker = " (default)" if default and choice in default else ""
-        print(f"  {idx}) {choice}{marker}")
-    print("  q) Quit")
+        menu.append(f"  {idx}) {choice}{marker}")
+    menu.append("  q) Quit")
+    print("\n".join(menu))
     while True:
         response = input("Select options (numbers or names separated by spaces/comma): ").strip()
         if response.lower() in ("q", "quit", "exit"):
@@ -479,7 +903,8 @@ def _select_multiple(
 
 def _text_input(message: str, default: Optional[str] = None) -> Optional[str]:
     """Prompt the user for free text. Uses questionary.text when available."""
-    if _HAVE_QUESTIONARY:
+    questionary = _get_questionary()
+    if questionary is not None:
         try:
             answer = questionary.text(message, default=default or "").ask()
             if answer is None:
@@ -499,21 +924,110 @@ def _text_input(message: str, default: Optional[str] = None) -> Optional[str]:
     return val
 
 
+def _copy_file_contents(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy size bytes from src_fd to dst_fd, in-kernel where possible.
+
+    Tries os.copy_file_range, then os.sendfile (Linux), then a user-space copy;
+    each step continues from the current file offsets. A kernel copy that
+    returns 0 before copying anything falls through to the next method.
+    """
+    kernel_copies = []
+    if hasattr(os, "copy_file_range"):
+        kernel_copies.append(lambda count: os.copy_file_range(src_fd, dst_fd, count))
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        kernel_copies.append(lambda count: os.sendfile(dst_fd, src_fd, None, count))
+    copied = 0
+    for kernel_copy in kernel_copies:
+        try:
+            while copied < size:
+                sent = kernel_copy(min(_COPY_CHUNK_SIZE, size - copied))
+                if sent == 0:
+                    break
+                copied += sent
+            # A 0 return before any data moved means this method can't copy
+            # the file (as shutil assumes), so try the next one; after some
+            # progress it is the real end of the file.
+            if copied or size == 0:
+                return
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    import shutil
+
+    with open(src_fd, "rb", closefd=False) as fsrc, open(
+        dst_fd, "wb", closefd=False
+    ) as fdst:
+        shutil.copyfileobj(fsrc, fdst)
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copy a file's contents and permission bits (not times or xattrs)."""
+    binary = getattr(os, "O_BINARY", 0)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        src_stat = os.fstat(src_fd)
+        mode = stat.S_IMODE(src_stat.st_mode)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL | binary, mode)
+        try:
+            _copy_file_contents(src_fd, dst_fd, src_stat.st_size)
+            if hasattr(os, "fchmod"):
+                os.fchmod(dst_fd, mode)
+            else:
+                os.chmod(dst, mode)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _fast_copytree(src: str, dst: str) -> None:
+    """Copy the directory tree at src to dst, which must not exist yet.
+
+    A lighter shutil.copytree: entries come from os.scandir, symlinks are
+    followed, and files are copied with _copy_file. Special files such as named
+    pipes and broken symlinks raise OSError.
+    """
+    os.mkdir(dst)
+    with os.scandir(src) as it:
+        entries = list(it)
+    for entry in entries:
+        dst_path = _join_name(dst, entry.name)
+        # Symlinks are followed so a link pointing outside the skill still
+        # installs its contents instead of a dangling link.
+        if entry.is_dir():
+            _fast_copytree(entry.path, dst_path)
+        elif entry.is_file():
+            _copy_file(entry.path, dst_path)
+        else:
+            # Opening a named pipe would block; sockets, devices and broken
+            # symlinks can't be copied either.
+            raise OSError(f"{entry.path} is not a regular file or directory")
+
+
 def _copy_skill_tree(source: str, destination_root: str) -> tuple[str, Optional[str]]:
     """Copy the skill directory into the destination root, avoiding overrides.
 
     Returns a tuple of (status, path) where status is one of: installed, exists,
     same, error.
     """
-    destination_root_exp = os.path.expanduser(destination_root)
+    destination_root_exp = _expand(destination_root)
     os.makedirs(destination_root_exp, exist_ok=True)
     destination_path = os.path.join(destination_root_exp, os.path.basename(source))
-    if os.path.abspath(destination_path) == os.path.abspath(source):
-        return "same", destination_path
-    if os.path.exists(destination_path):
+    # Compare (st_dev, st_ino) rather than path strings; this also catches the
+    # same directory reached through symlinks or "..".
+    try:
+        destination_stat = os.stat(destination_path)
+    except OSError:
+        destination_stat = None
+    if destination_stat is not None:
+        try:
+            if os.path.samestat(destination_stat, os.stat(source)):
+                return "same", destination_path
+        except OSError:
+            pass
         return "exists", destination_path
     try:
-        shutil.copytree(source, destination_path)
+        _fast_copytree(source, destination_path)
     except OSError as exc:
         print(f"  Failed to install into {destination_path}: {exc}")
         return "error", destination_path
@@ -609,16 +1123,10 @@ def run_interactive(config: dict) -> None:
             return
 
         if choice == "All":
-            # Collect paths from config (user and project) keeping order and uniqueness
-            paths: List[str] = []
-            seen = set()
-            for a in agent_dirs.values():
-                if not isinstance(a, dict):
-                    continue
-                for p in a.get("user", []) + a.get("project", []):
-                    if p not in seen:
-                        seen.add(p)
-                        paths.append(p)
+            # Paths from config (user and project), deduplicated in load_config
+            paths: List[str] = config.get("_all_paths") or _all_configured_paths(
+                agent_dirs
+            )
             if not paths:
                 print("No configured agent paths to list.")
                 return
@@ -641,6 +1149,14 @@ def main() -> None:
     """Main entry point for the skiller CLI."""
     config = load_config()
 
+    # No arguments: run the interactive UI (with text fallback when questionary
+    # isn't available) before argparse is even imported
+    if len(sys.argv) == 1:
+        run_interactive(config)
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="skiller",
         description="Helper script to discover, install and manage skills for AI agents",
@@ -656,6 +1172,12 @@ def main() -> None:
     )
     parser.add_argument("--interactive", action="store_true", help="Run interactive TUI")
     parser.add_argument("--install", action="store_true", help="Install a discovered skill")
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="With --dd, also report agent directories that were not found",
+    )
 
     args = parser.parse_args()
 
@@ -664,25 +1186,12 @@ def main() -> None:
         run_interactive(config)
         return
 
-    # If no args provided, default to interactive with questionary when possible
-    if len(sys.argv) == 1:
-        # If questionary isn't available, still run interactive fallback
-        run_interactive(config)
-        return
-
     # Preserve existing CLI behavior when args are supplied
     if args.list:
         # fallback: list all paths configured
-        agent_dirs = config.get("agent_dirs", {}) or {}
-        paths: List[str] = []
-        seen = set()
-        for a in agent_dirs.values():
-            if not isinstance(a, dict):
-                continue
-            for p in a.get("user", []) + a.get("project", []):
-                if p not in seen:
-                    seen.add(p)
-                    paths.append(p)
+        paths = config.get("_all_paths") or _all_configured_paths(
+            config.get("agent_dirs", {}) or {}
+        )
         list_installed_skills_for_paths(config, paths)
         return
 
@@ -695,7 +1204,7 @@ def main() -> None:
         target = args.dd or os.getcwd()
         # If config has custom_subdirs, use them; otherwise use sensible defaults
         custom_subdirs = config.get("custom_subdirs") or [".opencode/skills", ".claude/skills"]
-        discover_skills(target, custom_subdirs)
+        discover_skills(target, custom_subdirs, verbose=args.verbose)
         return
 
 
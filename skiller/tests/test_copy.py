@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+import skiller
+
+
+def _make_skill(root):
+    skill = root / "src" / "demo"
+    (skill / "scripts").mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: demo\n---\n")
+    (skill / "scripts" / "run.sh").write_text("echo hi\n")
+    os.chmod(skill / "scripts" / "run.sh", 0o755)
+    return skill
+
+
+def test_copy_skill_tree_copies_files_and_modes(tmp_path):
+    skill = _make_skill(tmp_path)
+    status, dest = skiller._copy_skill_tree(str(skill), str(tmp_path / "dst"))
+    assert status == "installed"
+    assert (tmp_path / "dst" / "demo" / "SKILL.md").read_text() == "---\nname: demo\n---\n"
+    script = os.path.join(dest, "scripts", "run.sh")
+    assert os.stat(script).st_mode & 0o777 == 0o755
+    status, _ = skiller._copy_skill_tree(str(skill), str(tmp_path / "dst"))
+    assert status == "exists"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_copy_skill_tree_rejects_named_pipe(tmp_path):
+    skill = _make_skill(tmp_path)
+    os.mkfifo(skill / "pipe")
+    status, _ = skiller._copy_skill_tree(str(skill), str(tmp_path / "dst"))
+    assert status == "error"
+
+
+def test_copy_file_contents_falls_back_when_kernel_copy_returns_zero(
+    tmp_path, monkeypatch
+):
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"x" * 5000)
+    dst = tmp_path / "dst.bin"
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, "sendfile", lambda *args: 0, raising=False)
+    skiller._copy_file(str(src), str(dst))
+    assert dst.read_bytes() == b"x" * 5000
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+def test_copy_skill_tree_follows_symlinks(tmp_path):
+    skill = _make_skill(tmp_path)
+    shared = tmp_path / "shared"
+    (shared / "docs").mkdir(parents=True)
+    (shared / "f.txt").write_text("shared\n")
+    (shared / "docs" / "g.txt").write_text("doc\n")
+    os.symlink(os.path.join("..", "..", "shared", "f.txt"), skill / "ref.txt")
+    os.symlink(str(shared / "docs"), skill / "docs")
+    status, dest = skiller._copy_skill_tree(str(skill), str(tmp_path / "dst"))
+    assert status == "installed"
+    installed = tmp_path / "dst" / "demo"
+    assert dest == str(installed)
+    assert not (installed / "ref.txt").is_symlink()
+    assert (installed / "ref.txt").read_text() == "shared\n"
+    assert not (installed / "docs").is_symlink()
+    assert (installed / "docs" / "g.txt").read_text() == "doc\n"
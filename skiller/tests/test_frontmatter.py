@@ -0,0 +1,145 @@
+import random
+
+import pytest
+import yaml
+
+import skiller
+
+CASES = [
+    b"name: a\ndescription: b",
+    b'name: a\ndescription: "Alpha: q"',
+    b"name: a\ndescription: 'it''s'",
+    b'name: a\ndescription: "esc \\n x"',
+    b"name: 123\ndescription: x",
+    b"name: true\ndescription: x",
+    b"name: a\ndescription:",
+    b"name: a\ndescription: zeta # c",
+    b"name: a\ndescription: >\n  fold\n  x",
+    b"name: a\nmeta:\n  k: v\ndescription: x",
+    b"name: a\ndescription: a: b",
+    b"name: a\ndescription: [a, b",
+    b"name: a\ndescription: {x: 1}",
+    b"name: a\ndescription: .inf",
+    b"name: a\ndescription: ~",
+    b"name: a\ndescription: null",
+    b"name:a",
+    b"just text",
+    b"# c\nname: a\n\ndescription: hi there, friend.",
+    b"name: a\nlicense: MIT\ndescription: Use when x > y",
+    b'name: a\ndescription: "unterminated',
+    b"name: a\ndescription: x\nname: b",
+    b"name: a\ndescription: ends with colon:",
+    b"name: caf\xc3\xa9\ndescription: d\xc3\xa9j\xc3\xa0",
+    b"name: a\ndescription: 2024-01-01",
+    b"name: a  \ndescription: trailing  ",
+    b"name: !!str 5\ndescription: x",
+    b"name: a\ndescription: x\n...",
+    b"name: a\nlicense: Apache-2.0\nallowed-tools: Read, Write",
+    b"name: a\nversion: 1.0\ndescription: x",
+    b"",
+    b"# only comment",
+    b"name: a\ndescription: it's fine",
+    b"name: a\ndescription: 50% off",
+    b"name: a\ndescription: a,b",
+    b"name: a\ndescription: x\t# tab comment",
+    b"title: foo",
+    b"true: x\nname: a",
+    b"yes: x",
+    b"Off: x",
+    b"null: x",
+    b"nothing: x",
+    b"tRUE: x",
+    b"name: <<",
+    b"name: '<<'",
+    b"name: a<<b",
+    b"name: a\x01b",
+    b"name: 'a\x1fb'",
+    b'name: "a\x7fb"',
+    b"name: a\rb",
+    b"name: a\r",
+    b"name: a\xc2\x85b",
+    b"name: 'a\xe2\x80\xa8b'",
+    b"name: a\xe2\x80\xa9b",
+    b"name: a\xc2\x9fb",
+    b"name: caf\xc3\xa9\xc2\xa0x",
+]
+
+
+def _yaml_frontmatter(header):
+    """Return what the YAML loader makes of header, as parse_frontmatter would."""
+    _, loader = skiller._get_yaml()
+    try:
+        parsed = yaml.load(header, Loader=loader)
+    except yaml.YAMLError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+_FUZZ_CHARS = [bytes([c]) for c in range(0x80) if c != 0x0A] + [
+    b"\xc2\x85",
+    b"\xc2\x9f",
+    b"\xc2\xa0",
+    b"\xc3\xa9",
+    b"\xe2\x80\xa8",
+    b"\xe2\x80\xa9",
+    b"\xef\xbb\xbf",
+    b"<<",
+]
+
+
+def _fuzz_cases(count=5000, seed=0):
+    rng = random.Random(seed)
+    keys = [b"name", b"description", b"true", b"yes", b"On", b"NULL", b"n", b"a-b"]
+    values = [b"", b"a", b"b c", b"1", b"1.5", b"yes", b"No", b"~", b"x: y", b"#c"]
+    for _ in range(count):
+        lines = []
+        for _ in range(rng.randint(1, 3)):
+            if rng.random() < 0.5:
+                value = rng.choice(values)
+            else:
+                value = b"".join(rng.choices(_FUZZ_CHARS, k=rng.randint(1, 5)))
+            quote = rng.choice([b"", b"", b"'", b'"'])
+            space = rng.choice([b"", b" ", b"  "])
+            lines.append(rng.choice(keys) + b":" + space + quote + value + quote)
+        yield b"\n".join(lines)
+
+
+@pytest.mark.parametrize("header", CASES)
+def test_simple_parser_matches_yaml(header):
+    simple = skiller._parse_simple_frontmatter(header)
+    if simple is not None:
+        assert simple == _yaml_frontmatter(header)
+
+
+def test_simple_parser_matches_yaml_fuzz():
+    for header in _fuzz_cases():
+        simple = skiller._parse_simple_frontmatter(header)
+        if simple is not None:
+            assert simple == _yaml_frontmatter(header), header
+
+
+@pytest.mark.parametrize("header", CASES)
+def test_parse_frontmatter_matches_yaml(tmp_path, header):
+    path = tmp_path / "SKILL.md"
+    path.write_bytes(b"---\n" + header + b"\n---\nbody\n")
+    assert skiller.parse_frontmatter(str(path)) == _yaml_frontmatter(header)
+
+
+def test_parse_frontmatter_crlf(tmp_path):
+    path = tmp_path / "SKILL.md"
+    path.write_bytes(b"---\r\nname: a\r\ndescription: b\r\n---\r\nbody\r\n")
+    assert skiller.parse_frontmatter(str(path)) == {"name": "a", "description": "b"}
+
+
+def test_parse_frontmatter_without_block(tmp_path):
+    path = tmp_path / "SKILL.md"
+    path.write_bytes(b"# Title\n---\nname: a\n---\n")
+    assert skiller.parse_frontmatter(str(path)) is None
+
+
+def test_list_reports_name_mismatch_for_frontmatter_without_name(tmp_path, capsys):
+    skill = tmp_path / "demo"
+    skill.mkdir()
+    (skill / "SKILL.md").write_text("---\ntitle: foo\n---\n")
+    skiller.list_installed_skills_for_paths({}, [str(tmp_path)])
+    assert "  - demo: (frontmatter missing or name mismatch)" in capsys.readouterr().out
@@ -0,0 +1,44 @@
+import skiller
+
+
+def _make_skills(root, count):
+    for i in range(count):
+        skill = root / f"s{i:02d}"
+        skill.mkdir()
+        (skill / "SKILL.md").write_text(f"---\nname: s{i:02d}\ndescription: d{i}\n---\n")
+    (root / "bare").mkdir()
+
+
+def test_listing_is_the_same_with_and_without_the_pool(tmp_path, monkeypatch, capsys):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _make_skills(first, 12)
+    _make_skills(second, 3)
+    paths = [str(first), str(tmp_path / "missing"), str(second)]
+
+    monkeypatch.setattr(skiller, "_io_workers", lambda: 1)
+    skiller.list_installed_skills_for_paths({}, paths)
+    serial = capsys.readouterr().out
+
+    skiller._FM_CACHE.clear()
+    monkeypatch.setattr(skiller, "_io_workers", lambda: 4)
+    skiller.list_installed_skills_for_paths({}, paths)
+    assert capsys.readouterr().out == serial
+    assert "  - s11: d11..." in serial
+    assert f"(missing) {tmp_path / 'missing'}" in serial
+    assert "  - bare: (no SKILL.md)" in serial
+
+
+def test_list_works_with_a_config_not_built_by_load_config(tmp_path, monkeypatch, capsys):
+    (tmp_path / "demo").mkdir()
+    config = {"agent_dirs": {"a": {"user": [str(tmp_path)]}}}
+    monkeypatch.setattr(skiller, "load_config", lambda: config)
+    monkeypatch.setattr(skiller.sys, "argv", ["skiller", "--list"])
+    skiller.main()
+    assert "  - demo: (no SKILL.md)" in capsys.readouterr().out
+
+
+def test_malformed_agent_dirs_index_as_empty():
+    assert skiller._index_agent_dirs(["not", "a", "mapping"]) == ({}, [])